@@ -3,14 +3,47 @@ import os
 import math
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import psutil
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSizePolicy
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSizePolicy,
+    QStyle, QStyleOption
 )
-from PyQt5.QtGui import QPainter, QColor, QFont, QIcon, QPixmap, QPen, QConicalGradient, QBrush
-from PyQt5.QtCore import Qt, QTimer, QEasingCurve, QPropertyAnimation, QRect, QRectF
+from PyQt5.QtGui import (
+    QPainter, QColor, QFont, QFontMetrics, QPixmap, QImage, QPen, QRegion, QPalette,
+    QPainterPath, QStaticText, QTransform
+)
+from PyQt5.QtCore import (
+    Qt, QEvent, QTimer, QEasingCurve, QPropertyAnimation, QPointF, QRect, QRectF,
+    QObject, QThread, QMetaObject, pyqtSignal, pyqtSlot, pyqtProperty
+)
+
+# Set CJMON_DEBUG=1 to print LHM load and GPU sensor diagnostics
+DEBUG = bool(os.environ.get("CJMON_DEBUG"))
+
+# Sampling intervals in seconds, overridable through the environment
+
+def _env_seconds(name, default):
+    """Read an interval in seconds from the environment, else use default"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        seconds = float(value)
+    except ValueError:
+        seconds = None
+    # Reject NaN/inf, 0 ms busy-loop timers and values that overflow QTimer
+    if seconds is None or not math.isfinite(seconds) or not 0.1 <= seconds <= 86400:
+        print(f" Ignoring invalid {name}={value!r}, using {default}s")
+        return default
+    return seconds
+
+FAST_INTERVAL = _env_seconds("CJMON_FAST_INTERVAL", 1.0)   # CPU, RAM, network
+GPU_INTERVAL = _env_seconds("CJMON_GPU_INTERVAL", 5.0)     # LHM GPU load
+FREQ_INTERVAL = _env_seconds("CJMON_FREQ_INTERVAL", 10.0)  # psutil.cpu_freq()
+MINI_INTERVAL = max(2.0, 2 * FAST_INTERVAL)                # mini mode only
 
 # Load LibreHardwareMonitor DLL (pythonnet / clr)
 
@@ -26,45 +59,120 @@ for p in dll_candidates:
         LIBRE_DLL = str(p.resolve())
         break
 
+# LHM is loaded lazily by _init_lhm() on a background thread started from
+# main(); the GPU meter shows "Initializing…" until _lhm_ready is set and
+# uses the psutil-based fallback if loading failed
 LHM_AVAILABLE = False
-if LIBRE_DLL:
+Hardware = None
+computer = None
+_lhm_ready = threading.Event()
+
+
+def _init_lhm():
+    """Load the LHM DLL and open the Computer object. Returns True on success."""
+    global LHM_AVAILABLE, Hardware, computer
+    
+    if not LIBRE_DLL:
+        print(" LibreHardwareMonitorLib.dll not found in ./libs/ — GPU sensors will use fallbacks.")
+        return False
+    
     try:
         import clr
         clr.AddReference(LIBRE_DLL)
-        from LibreHardwareMonitor import Hardware
-        LHM_AVAILABLE = True
-        print(f" LibreHardwareMonitor loaded from: {LIBRE_DLL}")
+        from LibreHardwareMonitor import Hardware as lhm_hardware
+        if DEBUG:
+            print(f" LibreHardwareMonitor loaded from: {LIBRE_DLL}")
     except Exception as e:
         print(f" Failed to load LibreHardwareMonitor DLL: {e}")
-        LHM_AVAILABLE = False
-else:
-    print(" LibreHardwareMonitorLib.dll not found in ./libs/ — GPU sensors will use fallbacks.")
+        return False
 
-# If LHM available, prepare Computer object
-computer = None
-if LHM_AVAILABLE:
+    # Prepare Computer object; CPU, RAM and network come from psutil, so
+    # only the GPU is enabled
     try:
-        computer = Hardware.Computer()
-        computer.IsCpuEnabled = True
-        computer.IsMemoryEnabled = True
-        computer.IsGpuEnabled = True
-        computer.IsMotherboardEnabled = True
-        computer.IsStorageEnabled = True
-        computer.Open()
-        print(" LibreHardwareMonitor Computer initialized successfully")
+        lhm_computer = lhm_hardware.Computer()
+        lhm_computer.IsGpuEnabled = True
+        lhm_computer.IsCpuEnabled = False
+        lhm_computer.IsMemoryEnabled = False
+        lhm_computer.IsMotherboardEnabled = False
+        lhm_computer.IsStorageEnabled = False
+        lhm_computer.IsNetworkEnabled = False
+        lhm_computer.Open()
+        if DEBUG:
+            print(" LibreHardwareMonitor Computer initialized successfully")
     except Exception as e:
         print(f" Error initializing LHM Computer: {e}")
-        computer = None
-        LHM_AVAILABLE = False
+        return False
+    
+    # Publish only once fully opened; readers check LHM_AVAILABLE first
+    Hardware = lhm_hardware
+    computer = lhm_computer
+    LHM_AVAILABLE = True
+    return True
 
 
+def start_lhm_init(on_done=None):
+    """Run _init_lhm() on a daemon thread, then set _lhm_ready and call on_done(ok)"""
+    def run():
+        ok = _init_lhm()
+        _lhm_ready.set()
+        if on_done is not None:
+            on_done(ok)
+    
+    threading.Thread(target=run, name="lhm-init", daemon=True).start()
+
+
+# QStaticText helpers shared by CircularMeter and MiniStatusWidget
+
+def _make_static_text(text, font):
+    """Create plain QStaticText with its layout prepared for font"""
+    static_text = QStaticText(text)
+    static_text.setTextFormat(Qt.PlainText)
+    static_text.prepare(QTransform(), font)
+    return static_text
+
+def _set_static_text(static_text, text, font):
+    """Replace the text of a QStaticText and prepare its new layout for font"""
+    static_text.setText(text)
+    static_text.prepare(QTransform(), font)
+
 # CircularMeter widget with improved text rendering
 
+def _percent_lut(stops):
+    """Expand (upper bound, item) bands into a list indexed by percent 0..100"""
+    return [next(item for bound, item in stops if percent <= bound)
+            for percent in range(101)]
+
 class CircularMeter(QWidget):
+    # Rasterized "N%" text shared by all meters, keyed by (text, font, color, dpr);
+    # at most 101 entries per theme and DPR, cleared on theme change
+    _text_cache = {}
+    
+    # Arc color bands as (upper bound in %, color), built once
+    _COLOR_STOPS = [
+        (20, QColor("#00ff88")),   # Green
+        (40, QColor("#00d4ff")),   # Cyan
+        (60, QColor("#ffd700")),   # Yellow
+        (80, QColor("#ff8c00")),   # Orange
+        (101, QColor("#ff4757")),  # Red
+    ]
+    
+    # Theme colors keyed by is_dark_mode
+    _TEXT_COLOR = {True: QColor("white"), False: QColor("#333333")}
+    _SECONDARY_TEXT_COLOR = {True: QColor("#cccccc"), False: QColor("#666666")}
+    _TRACK_COLOR = {True: QColor("#404040"), False: QColor("#e0e0e0")}
+    
+    # Arc pen for every integer percentage, so a lookup is a plain index;
+    # percentages in the same band share one pen
+    _PEN_LUT = _percent_lut([(threshold, QPen(color, 6, Qt.SolidLine, Qt.RoundCap))
+                             for threshold, color in _COLOR_STOPS])
+    _TRACK_PEN = {dark: QPen(color, 6, Qt.SolidLine, Qt.RoundCap)
+                  for dark, color in _TRACK_COLOR.items()}
+
     def __init__(self, label: str, diameter=160, parent=None):
         super().__init__(parent)
         self.label = label
-        self.value = 0.0  # 0..100
+        self._value = 0.0   # displayed value 0..100, animated towards _target
+        self._target = 0.0
         self.info = ""
         self.diameter = diameter
         self.is_dark_mode = True
@@ -77,163 +185,653 @@ class CircularMeter(QWidget):
         self._font_value = QFont("Segoe UI", 18, QFont.Bold)
         self._font_label = QFont("Segoe UI", 11, QFont.Bold)
         self._font_info = QFont("Segoe UI", 9)
+        
+        # Label and info keep their text layout in QStaticText; the label is
+        # laid out once, the info text again only when it changes
+        self._static_label = _make_static_text(self.label, self._font_label)
+        self._static_info = _make_static_text("", self._font_info)
+        
+        # Track and label are rendered once into a pixmap and only rebuilt on
+        # resize or theme change; arc, percentage and info are drawn per frame
+        self._static_cache = None
+        
+        # Frames are composed into a QImage and blitted to the widget in one call
+        self._buffer = None
+        self._buffer_dirty = True
+        
+        # Region changed by deferred setters, repainted by flush_update()
+        self._dirty_region = QRegion()
+        self._update_geometry()
+        
+        # Value changes are eased by Qt's animation timer, which steps all
+        # meters together and repaints only the arc rect on each step
+        self._value_anim = QPropertyAnimation(self, b"value", self)
+        self._value_anim.setDuration(400)
+        self._value_anim.setEasingCurve(QEasingCurve.OutCubic)
+
+    def _get_value(self):
+        return self._value
+
+    def _set_value(self, value):
+        if value != self._value:
+            self._value = value
+            self._buffer_dirty = True
+            self.update(self._arc_rect)
+
+    value = pyqtProperty(float, fget=_get_value, fset=_set_value)
+
+    def _update_geometry(self):
+        """Compute drawing rects for the current widget size"""
+        widget_rect = self.rect()
+        center_x = widget_rect.width() // 2
+        center_y = self.diameter // 2 + 10  
+        self._radius = radius = (self.diameter - 24) // 2 
+        
+        # Calculate drawing rectangle
+        draw_x = int(center_x - radius)
+        draw_y = int(center_y - radius)
+        draw_size = int(radius * 2)
+        self._draw_rect = QRect(draw_x, draw_y, draw_size, draw_size)
+        
+        # Track outline is built once per geometry and only stroked afterwards
+        self._track_path = QPainterPath()
+        self._track_path.addEllipse(QRectF(self._draw_rect))
+        
+        # Arc pen is 6px wide, so grow the dirty rect by half of it plus AA
+        self._arc_rect = self._draw_rect.adjusted(-4, -4, 4, 4)
+        self._text_rect = QRect(draw_x, int(center_y - 12), draw_size, 24)
+        
+        # Label below circle, info text below label
+        label_y = center_y + radius + 15  
+        self._label_rect = QRect(0, int(label_y), widget_rect.width(), 20)
+        self._info_rect = QRect(0, int(label_y + 25), widget_rect.width(), 16)
+        self._label_pos = self._centered_pos(self._label_rect, self._static_label)
+        self._info_pos = self._centered_pos(self._info_rect, self._static_info)
+
+    def resizeEvent(self, event):
+        self._update_geometry()
+        self._static_cache = None
+        self._buffer = None
+        super().resizeEvent(event)
 
     def set_dark_mode(self, is_dark):
         self.is_dark_mode = is_dark
+        self._static_cache = None
+        self._buffer_dirty = True
+        CircularMeter._text_cache.clear()
         self.update()
 
     def set_value(self, percent: float, info: str = ""):
-        self.value = max(0.0, min(100.0, float(percent)))
-        self.info = info
-        self.update()
+        self.set_value_deferred(percent, info)
+        self.flush_update()
 
-    def get_color_for_value(self, percent):
-        """Get color based on percentage value"""
-        if percent <= 20:
-            return QColor("#00ff88")  # Green
-        elif percent <= 40:
-            return QColor("#00d4ff")  # Cyan
-        elif percent <= 60:
-            return QColor("#ffd700")  # Yellow
-        elif percent <= 80:
-            return QColor("#ff8c00")  # Orange
-        else:
-            return QColor("#ff4757")  # Red
+    def set_value_deferred(self, percent: float, info: str = ""):
+        """Set value and info without scheduling a repaint (see flush_update)"""
+        # Rounded so sub-0.1% jitter doesn't restart the animation
+        value = round(max(0.0, min(100.0, float(percent))), 1)
+        
+        # Only invalidate the regions that actually changed
+        if info != self.info:
+            self.info = info
+            _set_static_text(self._static_info, info, self._font_info)
+            self._info_pos = self._centered_pos(self._info_rect, self._static_info)
+            self._buffer_dirty = True
+            self._dirty_region = self._dirty_region.united(self._info_rect)
+        # The arc is repainted by the animation steps, not here
+        if value != self._target:
+            self._target = value
+            self._value_anim.stop()
+            self._value_anim.setStartValue(self._value)
+            self._value_anim.setEndValue(value)
+            self._value_anim.start()
+
+    def flush_update(self):
+        """Schedule a single repaint for everything changed since the last flush"""
+        if not self._dirty_region.isEmpty():
+            self.update(self._dirty_region)
+            self._dirty_region = QRegion()
+
+    def get_pen_for_value(self, percent):
+        """Get the prebuilt arc pen for a percentage value"""
+        return self._PEN_LUT[int(percent)]
 
     def get_text_color(self):
         """Get appropriate text color based on theme"""
-        return QColor("white") if self.is_dark_mode else QColor("#333333")
+        return self._TEXT_COLOR[self.is_dark_mode]
 
     def get_secondary_text_color(self):
         """Get secondary text color based on theme"""
-        return QColor("#cccccc") if self.is_dark_mode else QColor("#666666")
+        return self._SECONDARY_TEXT_COLOR[self.is_dark_mode]
 
-    def get_track_color(self):
-        """Get track color based on theme"""
-        return QColor("#404040") if self.is_dark_mode else QColor("#e0e0e0")
+    @classmethod
+    def _cached_text_pixmap(cls, text, font, color, dpr):
+        """Get text in a tightly sized pixmap, rasterizing it on a miss"""
+        key = (text, font.key(), color.rgba(), dpr)
+        pixmap = cls._text_cache.get(key)
+        if pixmap is None:
+            # Font metrics are only queried on a miss; blits reuse the pixmap size
+            fm = QFontMetrics(font)
+            pixmap = QPixmap(fm.size(0, text) * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.TextAntialiasing)
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(0, fm.ascent(), text)
+            painter.end()
+            cls._text_cache[key] = pixmap
+        return pixmap
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+    @staticmethod
+    def _centered_pos(rect, static_text):
+        """Top-left position that centers static_text in rect"""
+        size = static_text.size()
+        return QPointF(rect.x() + (rect.width() - size.width()) / 2,
+                       rect.y() + (rect.height() - size.height()) / 2)
+
+    def _draw_text(self, painter, rect, text, font, color):
+        """Blit cached text centered in rect"""
+        dpr = self.devicePixelRatioF()
+        pixmap = self._cached_text_pixmap(text, font, color, dpr)
+        size = pixmap.size() / dpr
+        painter.drawPixmap(rect.x() + (rect.width() - size.width()) // 2,
+                           rect.y() + (rect.height() - size.height()) // 2,
+                           pixmap)
+
+    def _render_static_cache(self):
+        """Render the track circle and label into a pixmap"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
         
-        # Calculate dimensions
-        widget_rect = self.rect()
-        center_x = widget_rect.width() // 2
-        center_y = self.diameter // 2 + 10  
-        radius = (self.diameter - 24) // 2 
+        painter = QPainter(pixmap)
         
-        # Ensure valid dimensions
-        if radius <= 0:
-            return
+        # Background circle (track), the only curved shape in this layer
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.strokePath(self._track_path, self._TRACK_PEN[self.is_dark_mode])
+        painter.setRenderHint(QPainter.Antialiasing, False)
 
-        # Calculate drawing rectangle
-        draw_x = int(center_x - radius)
-        draw_y = int(center_y - radius)
-        draw_size = int(radius * 2)
+        # Label below circle with proper spacing (position precomputed)
+        painter.setFont(self._font_label)
+        painter.setPen(self.get_text_color())
+        painter.drawStaticText(self._label_pos, self._static_label)
+        
+        painter.end()
+        self._static_cache = pixmap
+
+    def _render_buffer(self):
+        """Compose the static layer, arc, percentage and info into the QImage buffer"""
+        if (self._static_cache is None or
+                self._static_cache.devicePixelRatioF() != self._buffer.devicePixelRatioF()):
+            self._render_static_cache()
         
-        # Background circle (track)
-        pen = QPen(self.get_track_color(), 6, Qt.SolidLine, Qt.RoundCap)
-        painter.setPen(pen)
-        painter.setBrush(Qt.NoBrush)
-        painter.drawEllipse(draw_x, draw_y, draw_size, draw_size)
+        self._buffer.fill(Qt.transparent)
+        painter = QPainter(self._buffer)
+        painter.drawPixmap(0, 0, self._static_cache)
 
-        # Progress arc
+        # Progress arc (antialiased; pixmap blits don't need it)
         if self.value > 0:
             start_angle = 90 * 16  # Start from top
             span_angle = int(-(360 * self.value / 100) * 16)  
             
-            arc_color = self.get_color_for_value(self.value)
-            pen = QPen(arc_color, 6, Qt.SolidLine, Qt.RoundCap)
-            painter.setPen(pen)
+            painter.setPen(self.get_pen_for_value(self.value))
             painter.setBrush(Qt.NoBrush)
-            painter.drawArc(draw_x, draw_y, draw_size, draw_size, start_angle, span_angle)
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            painter.drawArc(self._draw_rect, start_angle, span_angle)
+            painter.setRenderHint(QPainter.Antialiasing, False)
 
         # Center percentage text
-        painter.setPen(self.get_text_color())
-        painter.setFont(self._font_value)
-        text_rect = QRect(draw_x, int(center_y - 12), draw_size, 24)
-        painter.drawText(text_rect, Qt.AlignCenter, f"{int(self.value)}%")
-
-        # Label below circle with proper spacing
-        painter.setFont(self._font_label)
-        painter.setPen(self.get_text_color())
-        label_y = center_y + radius + 15  
-        label_rect = QRect(0, int(label_y), widget_rect.width(), 20)
-        painter.drawText(label_rect, Qt.AlignCenter, self.label)
+        self._draw_text(painter, self._text_rect, f"{int(self.value)}%",
+                        self._font_value, self.get_text_color())
 
         # Info text below label with more spacing
         if self.info:
             painter.setFont(self._font_info)
             painter.setPen(self.get_secondary_text_color())
-            info_y = label_y + 25  
-            info_rect = QRect(0, int(info_y), widget_rect.width(), 16)
-            painter.drawText(info_rect, Qt.AlignCenter, self.info)
+            painter.drawStaticText(self._info_pos, self._static_info)
+        
+        painter.end()
+        self._buffer_dirty = False
+
+    def paintEvent(self, event):
+        # Ensure valid dimensions
+        if self._radius <= 0:
+            return
+
+        dpr = self.devicePixelRatioF()
+        if self._buffer is None or self._buffer.devicePixelRatioF() != dpr:
+            self._buffer = QImage(self.size() * dpr, QImage.Format_ARGB32_Premultiplied)
+            self._buffer.setDevicePixelRatio(dpr)
+            self._buffer_dirty = True
+        if self._buffer_dirty:
+            self._render_buffer()
+        
+        painter = QPainter(self)
+        painter.drawImage(0, 0, self._buffer)
+
+# Primary screen geometry (shared by the main window and the mini widget)
+
+class PrimaryScreenGeometry(QObject):
+    """Caches the primary screen's available geometry and follows its changes"""
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        """Shared tracker, created on first use and owned by the QApplication"""
+        if cls._instance is None:
+            cls._instance = cls(QApplication.instance())
+        return cls._instance
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._screen = None
+        self._set_screen(QApplication.primaryScreen())
+        QApplication.instance().primaryScreenChanged.connect(self._set_screen)
+
+    def _set_screen(self, screen):
+        """Watch a new primary screen's available area (resolution, DPI, taskbar)"""
+        if self._screen is not None:
+            try:
+                self._screen.availableGeometryChanged.disconnect(self._set_geometry)
+            except (TypeError, RuntimeError):
+                pass  # old screen already removed
+        screen.availableGeometryChanged.connect(self._set_geometry)
+        self._screen = screen
+        self.geometry = screen.availableGeometry()
+
+    def _set_geometry(self, geom):
+        """Available area of the watched screen changed"""
+        self.geometry = geom
 
 # Mini Status Widget (Text-based)
 
 class MiniStatusWidget(QWidget):
+    # Stylesheets are built once per class, not per instance
+    _STYLE = """
+        background-color: #1a1c1e; 
+        color: white; 
+        border: none; 
+        border-radius: 8px;
+        padding: 8px;
+    """
+    
+    _BUTTON_STYLE = """
+        QPushButton {
+            background-color: #333333;
+            color: white;
+            border: none;
+            border-radius: 4px;
+        }
+        QPushButton:hover {
+            background-color: #444444;
+        }
+        QPushButton:pressed {
+            background-color: #222222;
+        }
+    """
+
+    _TEXT_COLOR = QColor("white")
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowFlags(Qt.WindowStaysOnTopHint | Qt.FramelessWindowHint | Qt.Tool)
         self.setFixedSize(300, 36)  
         
         # Dark background with no border
-        self.setStyleSheet("""
-            background-color: #1a1c1e; 
-            color: white; 
-            border: none; 
-            border-radius: 8px;
-            padding: 8px;
-        """)
+        self.setStyleSheet(self._STYLE)
         
         # Layout
         layout = QHBoxLayout(self)
         layout.setContentsMargins(10, 4, 10, 4) 
         layout.setSpacing(0)
         
-        # Status label with bold font
-        self.status_label = QLabel("CPU 0% | RAM 0% | GPU 0%")
-        self.status_label.setFont(QFont("Segoe UI", 9, QFont.Bold))  
-        self.status_label.setStyleSheet("color: white; background: transparent;")
+        # Status text is painted directly from a QStaticText, which keeps its
+        # layout between paints; only the text rect is repainted on change
+        self._font_status = QFont("Segoe UI", 9, QFont.Bold)
+        self._last_text = "CPU 0% | RAM 0% | GPU 0%"
+        self._static_status = _make_static_text(self._last_text, self._font_status)
+        self._text_rect = QRect(10, 0, self.width() - 50, self.height())
         
         # Restore button
         self.restore_btn = QPushButton("⬆")
         self.restore_btn.setFixedSize(30, 30)  # Smaller button
         self.restore_btn.setFont(QFont("Segoe UI", 10, QFont.Bold))  
-        self.restore_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #333333;
-                color: white;
-                border: none;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #444444;
-            }
-            QPushButton:pressed {
-                background-color: #222222;
-            }
-        """)
-        
-        layout.addWidget(self.status_label)
+        self.restore_btn.setStyleSheet(self._BUTTON_STYLE)
+        
         layout.addStretch()
         layout.addWidget(self.restore_btn)
-
+        
     def update_status(self, cpu_percent, ram_percent, gpu_percent):
         """Update the status text"""
         status_text = f"CPU {int(cpu_percent)}% | RAM {int(ram_percent)}% | GPU {int(gpu_percent)}%"
-        self.status_label.setText(status_text)
+        
+        # Skip the relayout/repaint when the rounded numbers didn't change
+        if status_text == self._last_text:
+            return
+        self._last_text = status_text
+        _set_static_text(self._static_status, status_text, self._font_status)
+        self.update(self._text_rect)
+
+    def paintEvent(self, event):
+        # Stylesheet background first, then the status text
+        option = QStyleOption()
+        option.initFrom(self)
+        painter = QPainter(self)
+        self.style().drawPrimitive(QStyle.PE_Widget, option, painter, self)
+        
+        painter.setFont(self._font_status)
+        painter.setPen(self._TEXT_COLOR)
+        y = (self.height() - self._static_status.size().height()) / 2
+        painter.drawStaticText(QPointF(self._text_rect.x(), y), self._static_status)
 
     def position_at_top_right(self):
         """Position widget at top-right of screen"""
-        screen = QApplication.primaryScreen().availableGeometry()
+        screen = PrimaryScreenGeometry.instance().geometry
         x = screen.width() - self.width() - 20
         y = 20
         self.move(x, y)
 
+# Sensor Worker (runs on a background QThread)
+
+class SensorWorker(QObject):
+    sampled = pyqtSignal(dict)
+
+    # Re-scan LHM hardware after this many reads without a GPU load value
+    _GPU_REDISCOVER_AFTER = 5
+    
+    # Rebuild the system info line only every this many samples
+    _SYSINFO_EVERY = 10
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        # Network monitoring
+        self.last_net = psutil.net_io_counters()
+        self.last_time_ns = time.monotonic_ns()
+        self._inv_net_max_bps = 100.0 / (10 << 20)  # 10MB/s = 100%
+        
+        # Values that never change while we run
+        self._cpu_count = psutil.cpu_count(logical=False)
+        self._cpu_count_logical = psutil.cpu_count(logical=True)
+        self._mem_total = psutil.virtual_memory().total
+        self._ram_total_text = f"{self._mem_total/(1024**3):.1f} GB Total"  # RAM meter info
+        self._boot_time = psutil.boot_time()
+        
+        # System info line with the static parts already filled in
+        self._sysinfo_template = (
+            f"🔥 CPU: {self._cpu_count}C/{self._cpu_count_logical}T @ {{freq}} | "
+            f"💾 RAM: {{mem_available:.1f}}GB/{self._mem_total / (1024**3):.1f}GB Available | "
+            "⏱️ Uptime: {hours}h {minutes}m |"
+        )
+        self._system_info = ""
+        self._sysinfo_count = 0
+        
+        # Last sample, reused for calls closer together than the sampling window
+        self._last_sample_ts = 0.0
+        self._cached_sample = None
+        
+        # (hardware, load sensors) for every GPU found by _discover_gpu();
+        # steady-state reads touch only these instead of walking every sensor
+        self._gpus = []
+        self._gpu_name = "Integrated Graphics"
+        self._gpu_misses = self._GPU_REDISCOVER_AFTER  # discover on first read
+        
+        # GPU load changes slowly and is expensive to read, so it is
+        # refreshed on its own interval and reused in between
+        self._lhm_gpu = (0.0, self._gpu_name)
+        self._next_gpu_read = 0.0
+        
+        # Slow-changing psutil results by key as (monotonic time, value), see
+        # _cached(); per-tick reads are already limited by the gate in sample()
+        self._psutil_cache = {}
+        
+        # All LHM calls go through this single thread
+        self._lhm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="lhm")
+        
+        # Set by the GUI when it queues a sample, cleared when the sample is done
+        self.busy = threading.Event()
+
+    @pyqtSlot()
+    def sample(self):
+        """Collect one sample on the worker thread and hand it to the GUI"""
+        try:
+            # Reuse the last sample if called again within the sampling window
+            # (cpu_percent needs a real delta between two reads)
+            now = time.monotonic()
+            if self._cached_sample is None or now - self._last_sample_ts >= 0.9 * FAST_INTERVAL:
+                self._cached_sample = self._sample_system()
+                self._last_sample_ts = now
+            self.sampled.emit(self._cached_sample)
+        except Exception as e:
+            print(f" Error sampling stats: {e}")
+        finally:
+            self.busy.clear()
+
+    def shutdown(self):
+        """Stop the LHM reader thread"""
+        self._lhm_executor.shutdown(wait=True)
+
+    def _discover_gpu(self):
+        """Scan LHM hardware once for all GPUs and their load sensors"""
+        self._gpus = []
+        
+        for hw in computer.Hardware:
+            # Check for any GPU type
+            if hw.HardwareType not in (Hardware.HardwareType.GpuNvidia,
+                                       Hardware.HardwareType.GpuAmd,
+                                       Hardware.HardwareType.GpuIntel):
+                continue
+            
+            hw.Update()
+            load_sensors = [sensor for sensor in hw.Sensors
+                            if sensor.SensorType == Hardware.SensorType.Load]
+            if not load_sensors:
+                continue
+            
+            # Look for GPU Core Load or similar, else use the first Load sensor
+            sensors = [s for s in load_sensors
+                       if any(keyword in (s.Name or "").lower()
+                              for keyword in ('gpu', 'core', 'load', '3d', 'graphics'))]
+            sensors = sensors or load_sensors[:1]
+            
+            self._gpus.append((hw, sensors))
+            if DEBUG:
+                print(f"🎮 Found GPU: {hw.Name}, using sensors: {[s.Name for s in sensors]}")
+        
+        if self._gpus:
+            self._gpu_name = self._gpus[0][0].Name
+
+    def _read_lhm_gpu(self):
+        """Read the busiest GPU's load and name from LibreHardwareMonitor (0.0 if unavailable)"""
+        gpu_percent = 0.0
+        
+        if LHM_AVAILABLE and computer is not None:
+            try:
+                if self._gpu_misses >= self._GPU_REDISCOVER_AFTER:
+                    self._gpu_misses = 0
+                    self._discover_gpu()
+                
+                # Hybrid systems often list an idle dGPU first, so read every
+                # GPU and report the busiest one
+                found = False
+                for hw, sensors in self._gpus:
+                    hw.Update()
+                    values = [s.Value for s in sensors if s.Value is not None]
+                    if not values:
+                        continue
+                    load = float(max(values))
+                    if not found or load > gpu_percent:
+                        gpu_percent = load
+                        self._gpu_name = hw.Name
+                    found = True
+                
+                if found:
+                    self._gpu_misses = 0
+                else:
+                    self._gpu_misses += 1
+                    
+            except Exception as e:
+                if DEBUG:
+                    print(f" GPU monitoring error: {e}")
+                gpu_percent = 0.0
+                self._gpu_misses = self._GPU_REDISCOVER_AFTER
+        
+        return gpu_percent, self._gpu_name
+
+    def get_gpu_usage(self, lhm_reading, cpu_percent_hint):
+        """Get GPU usage from an LHM (load, name) reading taken on the LHM thread"""
+        if not _lhm_ready.is_set():
+            return 0.0, "Initializing…"
+        
+        gpu_percent, gpu_name = lhm_reading
+        
+        # Fallback if no valid GPU data
+        if gpu_percent == 0.0:
+            # Use CPU-based approximation for systems without discrete GPU
+            gpu_percent = min(cpu_percent_hint * 0.3, 100.0)  # Conservative estimate
+            
+        return gpu_percent, gpu_name
+
+    def get_system_info(self, mem, cpu_freq):
+        """Get comprehensive system information from this tick's readings"""
+        try:
+            # CPU info
+            freq_text = f"{cpu_freq.current:.0f}MHz" if cpu_freq else "Unknown"
+            
+            # Uptime
+            uptime = int(time.time() - self._boot_time)
+            
+            return self._sysinfo_template.format(
+                freq=freq_text,
+                mem_available=mem.available / (1024**3),
+                hours=uptime // 3600,
+                minutes=uptime % 3600 // 60,
+            )
+                   
+        except Exception as e:
+            return f"⚠️ System info error: {str(e)}"
+
+    def _cached(self, key, fn, ttl):
+        """Return fn()'s last result if it is younger than ttl seconds"""
+        now = time.monotonic()
+        entry = self._psutil_cache.get(key)
+        if entry is None or now - entry[0] >= ttl:
+            entry = self._psutil_cache[key] = (now, fn())
+        return entry[1]
+
+    def _sample_system(self):
+        """Read all system counters once for this tick"""
+        now = time.monotonic()
+        
+        # Start the LHM read first so its latency overlaps the psutil reads
+        lhm_future = None
+        if _lhm_ready.is_set() and now >= self._next_gpu_read:
+            self._next_gpu_read = now + GPU_INTERVAL
+            lhm_future = self._lhm_executor.submit(self._read_lhm_gpu)
+        
+        cpu_percent = psutil.cpu_percent(interval=None)  # non-blocking
+        mem = psutil.virtual_memory()
+        # Not cached: a repeated counter read would show up as a zero rate
+        net_current = psutil.net_io_counters()
+        current_ns = time.monotonic_ns()  # stamped with the counters, immune to clock steps
+        cpu_freq = self._cached("cpu_freq", psutil.cpu_freq, FREQ_INTERVAL)
+        
+        # GPU usage with improved detection
+        if lhm_future is not None:
+            self._lhm_gpu = lhm_future.result()
+        gpu_percent, gpu_info = self.get_gpu_usage(self._lhm_gpu, cpu_percent)
+        
+        # Network usage calculation
+        time_diff_ns = current_ns - self.last_time_ns
+        
+        total_bytes_per_sec = 0
+        if time_diff_ns > 0:
+            rx = net_current.bytes_recv - self.last_net.bytes_recv
+            tx = net_current.bytes_sent - self.last_net.bytes_sent
+            total_bytes_per_sec = (rx + tx) * 1_000_000_000 // time_diff_ns
+            net_percent = min(total_bytes_per_sec * self._inv_net_max_bps, 100.0)
+        else:
+            net_percent = 0
+            
+        self.last_net = net_current
+        self.last_time_ns = current_ns
+        
+        # Uptime is shown in minutes and frequency barely moves
+        if self._sysinfo_count % self._SYSINFO_EVERY == 0:
+            self._system_info = self.get_system_info(mem, cpu_freq)
+        self._sysinfo_count += 1
+        
+        return {
+            "cpu_percent": cpu_percent,
+            "mem": mem,
+            "ram_total_text": self._ram_total_text,
+            "cpu_freq": cpu_freq,
+            "gpu_percent": gpu_percent,
+            "gpu_info": gpu_info,
+            "net_percent": net_percent,
+            "net_bytes_per_sec": total_bytes_per_sec,
+            "system_info": self._system_info,
+        }
+
 # Main Window
 
 class MonitorWindow(QWidget):
+    lhm_ready = pyqtSignal(bool)
+
+    # Window and label colors come from a QPalette per theme; CSS is only
+    # kept on the few widgets that need shapes a palette can't express
+    _DARK_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #2d3142;
+            border: 2px solid #4f5b66;
+            border-radius: 12px;
+            color: white;
+        }
+        QPushButton:hover {
+            background-color: #3d4152;
+            border-color: #6f7b86;
+        }
+        QPushButton:pressed {
+            background-color: #1d2132;
+        }
+    """
+    
+    _DARK_INFO_STYLE = """
+        color: #cccccc; 
+        padding: 15px; 
+        background-color: rgba(255,255,255,0.05); 
+        border-radius: 10px;
+        border: 1px solid #333333;
+    """
+    
+    _LIGHT_BUTTON_STYLE = """
+        QPushButton {
+            background-color: #e9ecef;
+            border: 2px solid #ced4da;
+            border-radius: 12px;
+            color: #333333;
+        }
+        QPushButton:hover {
+            background-color: #dee2e6;
+            border-color: #adb5bd;
+        }
+        QPushButton:pressed {
+            background-color: #ced4da;
+        }
+    """
+    
+    _LIGHT_INFO_STYLE = """
+        color: #495057; 
+        padding: 15px; 
+        background-color: rgba(0,0,0,0.05); 
+        border-radius: 10px;
+        border: 1px solid #dee2e6;
+    """
+    
+    _TITLE_STYLE = "color: #0066cc; font-weight: bold;"
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(" CJ Resource Monitor Pro | CODE with CJ")
@@ -247,6 +845,11 @@ class MonitorWindow(QWidget):
         
         # Theme state
         self.is_dark_mode = True
+        self._dark_palette = self._make_palette("#1a1c1e", "white", "#2d3142")
+        self._light_palette = self._make_palette("#f8f9fa", "#333333", "#e9ecef")
+        
+        # Last system info line set on the label
+        self._sysinfo_last = ""
         
         # Setup UI
         self.setup_ui()
@@ -256,14 +859,29 @@ class MonitorWindow(QWidget):
         self.mini_widget = MiniStatusWidget()
         self.mini_widget.restore_btn.clicked.connect(self.exit_mini_mode)
         
+        # Sensor polling (psutil + LHM) runs on a worker thread
+        self.worker_thread = QThread()
+        self.worker = SensorWorker()
+        self.worker.moveToThread(self.worker_thread)
+        self.worker.sampled.connect(self.apply_sample)
+        self.worker_thread.finished.connect(self.worker.deleteLater)
+        self.worker_thread.start()
+        
         # Timer for stats updates
+        # Coarse timers let the OS batch our wakeups with others
         self.timer = QTimer()
-        self.timer.timeout.connect(self.update_stats)
-        self.timer.start(1000)
+        self.timer.setTimerType(Qt.CoarseTimer)
+        self.timer.timeout.connect(self.request_sample)
+        self.timer.setInterval(int(FAST_INTERVAL * 1000))
+        self.timer.start()
         
-        # Network monitoring
-        self.last_net = psutil.net_io_counters()
-        self.last_time = time.time()
+        # Slower timer used instead while only the mini widget is shown
+        self.mini_timer = QTimer()
+        self.mini_timer.setTimerType(Qt.VeryCoarseTimer)
+        self.mini_timer.timeout.connect(self.request_sample)
+        
+        # Emitted from the LHM init thread started by main()
+        self.lhm_ready.connect(self.on_lhm_ready)
         
         # Center window
         self.center_window()
@@ -286,6 +904,7 @@ class MonitorWindow(QWidget):
         self.title_label = QLabel("⚡ CJ RESOURCE MONITOR ⚡")
         self.title_label.setFont(QFont("Segoe UI", 20, QFont.Bold))
         self.title_label.setAlignment(Qt.AlignCenter)
+        self.title_label.setStyleSheet(self._TITLE_STYLE)  # same in both themes
         
         # Control buttons
         controls_layout = QHBoxLayout()
@@ -340,245 +959,143 @@ class MonitorWindow(QWidget):
         self.system_info.setWordWrap(True)
         main_layout.addWidget(self.system_info)
 
-def apply_theme(self):
+    @staticmethod
+    def _make_palette(background, text, button):
+        """Build a theme palette from its base colors"""
+        palette = QPalette()
+        for role in (QPalette.Window, QPalette.Base):
+            palette.setColor(role, QColor(background))
+        for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+            palette.setColor(role, QColor(text))
+        palette.setColor(QPalette.Button, QColor(button))
+        return palette
+
+    def apply_theme(self):
         """Apply theme to the entire application"""
         if self.is_dark_mode:
-            # Dark theme
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: #1a1c1e;
-                    color: white;
-                }
-                QPushButton {
-                    background-color: #2d3142;
-                    border: 2px solid #4f5b66;
-                    border-radius: 12px;
-                    color: white;
-                }
-                QPushButton:hover {
-                    background-color: #3d4152;
-                    border-color: #6f7b86;
-                }
-                QPushButton:pressed {
-                    background-color: #1d2132;
-                }
-                QLabel {
-                    color: white;
-                }
-            """)
-            
-            self.title_label.setStyleSheet("color: #0066cc; font-weight: bold;")
-            self.system_info.setStyleSheet("""
-                color: #cccccc; 
-                padding: 15px; 
-                background-color: rgba(255,255,255,0.05); 
-                border-radius: 10px;
-                border: 1px solid #333333;
-            """)
-            
+            self.setPalette(self._dark_palette)
+            button_style, info_style = self._DARK_BUTTON_STYLE, self._DARK_INFO_STYLE
         else:
-            # Light theme
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: #f8f9fa;
-                    color: #333333;
-                }
-                QPushButton {
-                    background-color: #e9ecef;
-                    border: 2px solid #ced4da;
-                    border-radius: 12px;
-                    color: #333333;
-                }
-                QPushButton:hover {
-                    background-color: #dee2e6;
-                    border-color: #adb5bd;
-                }
-                QPushButton:pressed {
-                    background-color: #ced4da;
-                }
-                QLabel {
-                    color: #333333;
-                }
-            """)
-            
-            self.title_label.setStyleSheet("color: #0066cc; font-weight: bold;")
-            self.system_info.setStyleSheet("""
-                color: #495057; 
-                padding: 15px; 
-                background-color: rgba(0,0,0,0.05); 
-                border-radius: 10px;
-                border: 1px solid #dee2e6;
-            """)
+            self.setPalette(self._light_palette)
+            button_style, info_style = self._LIGHT_BUTTON_STYLE, self._LIGHT_INFO_STYLE
+        
+        # Only these widgets carry CSS, so only they get re-polished
+        self.theme_btn.setStyleSheet(button_style)
+        self.mini_btn.setStyleSheet(button_style)
+        self.system_info.setStyleSheet(info_style)
         
         # Update meters theme
         for meter in [self.cpu_meter, self.ram_meter, self.gpu_meter, self.net_meter]:
             meter.set_dark_mode(self.is_dark_mode)
 
-def center_window(self):
+    def center_window(self):
         """Center the window on screen"""
-        screen = QApplication.primaryScreen().availableGeometry()
+        screen = PrimaryScreenGeometry.instance().geometry
         x = (screen.width() - self.width()) // 2
         y = (screen.height() - self.height()) // 2
         self.move(x, y)
 
-def toggle_theme(self):
+    def toggle_theme(self):
         """Toggle between dark and light themes"""
         self.is_dark_mode = not self.is_dark_mode
         self.theme_btn.setText("☀️" if self.is_dark_mode else "🌙")
         self.apply_theme()
 
-def enter_mini_mode(self):
+    def enter_mini_mode(self):
         """Switch to mini text-based mode"""
+        self.timer.stop()
+        self.mini_timer.start(int(MINI_INTERVAL * 1000))
         self.hide()
         self.mini_widget.position_at_top_right()
         self.mini_widget.show()
+        self.request_sample()
 
-def exit_mini_mode(self):
+    def exit_mini_mode(self):
         """Switch back to full mode"""
+        self.mini_timer.stop()
         self.mini_widget.hide()
         self.center_window()
         self.show()
         self.raise_()
-def get_gpu_usage(self):
-        """Get GPU usage with improved LibreHardwareMonitor integration"""
-        gpu_percent = 0.0
-        gpu_name = "Integrated Graphics"
-        
-        if LHM_AVAILABLE and computer:
-            try:
-                for hw in computer.Hardware:
-                    hw.Update()
-                    
-                    # Check for any GPU type
-                    if hw.HardwareType in (Hardware.HardwareType.GpuNvidia,
-                                         Hardware.HardwareType.GpuAmd,
-                                         Hardware.HardwareType.GpuIntel):
-                        
-                        gpu_name = hw.Name
-                        print(f"🎮 Found GPU: {gpu_name}")  # Debug info
-                        
-                        # Look through all sensors
-                        for sensor in hw.Sensors:
-                            sensor_name = sensor.Name or ""
-                            sensor_value = sensor.Value
-                            
-                            print(f"   Sensor: {sensor_name} = {sensor_value} ({sensor.SensorType})")  # Debug
-                            
-                            # Look for GPU Core Load or similar
-                            if (sensor.SensorType == Hardware.SensorType.Load and 
-                                sensor_value is not None):
-                                
-                                if any(keyword in sensor_name.lower() for keyword in 
-                                      ['gpu', 'core', 'load', '3d', 'graphics']):
-                                    gpu_percent = max(gpu_percent, float(sensor_value))
-                                    print(f"  Using sensor: {sensor_name} = {gpu_percent}%")
-                        
-                        # If we found a GPU but no load sensors, try alternative approach
-                        if gpu_percent == 0.0:
-                            for sensor in hw.Sensors:
-                                if (sensor.SensorType == Hardware.SensorType.Load and 
-                                    sensor.Value is not None):
-                                    gpu_percent = float(sensor.Value)
-                                    print(f"  Using first Load sensor: {sensor.Name} = {gpu_percent}%")
-                                    break
-                        
-                        if gpu_percent > 0:
-                            break  # Found working GPU
-                            
-            except Exception as e:
-                print(f" GPU monitoring error: {e}")
-                gpu_percent = 0.0
-        
-        # Fallback if no valid GPU data
-        if gpu_percent == 0.0:
-            # Use CPU-based approximation for systems without discrete GPU
-            cpu_percent = psutil.cpu_percent()
-            gpu_percent = min(cpu_percent * 0.3, 100.0)  # Conservative estimate
-            
-        return gpu_percent, gpu_name
+        self._resume_sampling()
 
-def get_system_info(self):
-        """Get comprehensive system information"""
-        try:
-            # CPU info
-            cpu_count = psutil.cpu_count(logical=False)
-            cpu_count_logical = psutil.cpu_count(logical=True)
-            cpu_freq = psutil.cpu_freq()
-            freq_text = f"{cpu_freq.current:.0f}MHz" if cpu_freq else "Unknown"
-            
-            # Memory info
-            mem = psutil.virtual_memory()
-            mem_total = mem.total / (1024**3)
-            mem_available = mem.available / (1024**3)
-            
-            # Boot time
-            boot_time = psutil.boot_time()
-            uptime = time.time() - boot_time
-            uptime_hours = int(uptime // 3600)
-            uptime_minutes = int((uptime % 3600) // 60)
-            
-            return (f"🔥 CPU: {cpu_count}C/{cpu_count_logical}T @ {freq_text} | "
-                   f"💾 RAM: {mem_available:.1f}GB/{mem_total:.1f}GB Available | "
-                   f"⏱️ Uptime: {uptime_hours}h {uptime_minutes}m |")
-                   
-        except Exception as e:
-            return f"⚠️ System info error: {str(e)}"
+    def _resume_sampling(self):
+        """Sample now, then restart the full-mode timer"""
+        self.request_sample()
+        self.timer.start()
+
+    def changeEvent(self, event):
+        """Stop sampling while minimized to the taskbar, nothing is shown then"""
+        if event.type() == QEvent.WindowStateChange and not self.mini_widget.isVisible():
+            if self.isMinimized():
+                self.timer.stop()
+            elif not self.timer.isActive():
+                self._resume_sampling()
+        super().changeEvent(event)
+
+    @pyqtSlot(bool)
+    def on_lhm_ready(self, ok):
+        """LHM finished loading; the worker picks it up on its next sample"""
+        print(f" LibreHardwareMonitor: {' Active' if ok else ' Using Fallbacks'}")
 
-def update_stats(self):
-        """Update all system statistics"""
+    def request_sample(self):
+        """Queue a sample on the worker thread"""
+        # A slow psutil/LHM read must not let timer ticks pile up behind it
+        if self.worker.busy.is_set():
+            return
+        self.worker.busy.set()
+        QMetaObject.invokeMethod(self.worker, "sample", Qt.QueuedConnection)
+
+    @pyqtSlot(dict)
+    def apply_sample(self, sample):
+        """Update all widgets from a worker sample"""
         try:
-            # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=None)
-            
-            # RAM usage  
-            mem = psutil.virtual_memory()
+            cpu_percent = sample["cpu_percent"]
+            mem = sample["mem"]
             ram_percent = mem.percent
+            gpu_percent = sample["gpu_percent"]
+            gpu_info = sample["gpu_info"]
+            net_percent = sample["net_percent"]
+            total_bytes_per_sec = sample["net_bytes_per_sec"]
+
+            # Update mini widget
+            if self.mini_widget.isVisible():
+                self.mini_widget.update_status(cpu_percent, ram_percent, gpu_percent)
             
-            # GPU usage with improved detection
-            gpu_percent, gpu_info = self.get_gpu_usage()
-            
-            # Network usage calculation
-            current_time = time.time()
-            net_current = psutil.net_io_counters()
-            time_diff = current_time - self.last_time
-            
-            total_bytes_per_sec = 0
-            if time_diff > 0:
-                bytes_sent_per_sec = (net_current.bytes_sent - self.last_net.bytes_sent) / time_diff
-                bytes_recv_per_sec = (net_current.bytes_recv - self.last_net.bytes_recv) / time_diff
-                total_bytes_per_sec = bytes_sent_per_sec + bytes_recv_per_sec
-                
-                # Convert to percentage (10MB/s = 100%)
-                net_percent = min((total_bytes_per_sec / (10 * 1024 * 1024)) * 100, 100)
-            else:
-                net_percent = 0
-                
-            self.last_net = net_current
-            self.last_time = current_time
+            # Nothing else to paint while the main window is hidden or minimized
+            if not self.isVisible() or self.isMinimized():
+                return
 
             # Update main meters
-            cpu_freq = psutil.cpu_freq()
+            cpu_freq = sample["cpu_freq"]
             cpu_freq_text = f"{cpu_freq.current/1000:.2f} GHz" if cpu_freq else "N/A"
             
-            self.cpu_meter.set_value(cpu_percent, cpu_freq_text)
-            self.ram_meter.set_value(ram_percent, f"{mem.total/(1024**3):.1f} GB Total")
-            self.gpu_meter.set_value(gpu_percent, gpu_info[:30] + "..." if len(gpu_info) > 30 else gpu_info)
-            self.net_meter.set_value(net_percent, f"{total_bytes_per_sec/(1024*1024):.1f} MB/s")
-
-            # Update mini widget
-            if self.mini_widget.isVisible():
-                self.mini_widget.update_status(cpu_percent, ram_percent, gpu_percent)
+            self.cpu_meter.set_value_deferred(cpu_percent, cpu_freq_text)
+            self.ram_meter.set_value_deferred(ram_percent, sample["ram_total_text"])
+            self.gpu_meter.set_value_deferred(gpu_percent, gpu_info[:30] + "..." if len(gpu_info) > 30 else gpu_info)
+            self.net_meter.set_value_deferred(net_percent, f"{total_bytes_per_sec/(1024*1024):.1f} MB/s")
+            
+            # Schedule all meter repaints together so Qt handles them in one pass
+            for meter in (self.cpu_meter, self.ram_meter, self.gpu_meter, self.net_meter):
+                meter.flush_update()
 
-            # Update system info
-            self.system_info.setText(self.get_system_info())
+            # Update system info only when the line was rebuilt with new content
+            if sample["system_info"] != self._sysinfo_last:
+                self._sysinfo_last = sample["system_info"]
+                self.system_info.setText(self._sysinfo_last)
 
         except Exception as e:
             print(f" Error updating stats: {e}")
 
-def closeEvent(self, event):
+    def closeEvent(self, event):
         """Handle application close"""
+        self.timer.stop()
+        self.mini_timer.stop()
+        self.worker_thread.quit()
+        self.worker_thread.wait()
+        self.worker.shutdown()
         self.mini_widget.close()
-        if LHM_AVAILABLE and computer:
+        if LHM_AVAILABLE and computer is not None:
             try:
                 computer.Close()
             except:
@@ -596,10 +1113,12 @@ def main():
     
     try:
         window = MonitorWindow()
+        
+        # Load LibreHardwareMonitor without delaying the first paint
+        start_lhm_init(window.lhm_ready.emit)
         window.show()
         
         print(" CJ Resource Monitor Pro started successfully!")
-        print(f" LibreHardwareMonitor: {' Active' if LHM_AVAILABLE else ' Using Fallbacks'}")
         print("=" * 50)
         
         sys.exit(app.exec_())